@@ -6,7 +6,7 @@ up for each one, optionally inject a probe frame, and
 print any traffic seen.
 
 Requires:
-  • python-can      (pip install python-can)
+  • Linux SocketCAN (raw AF_CAN sockets – stdlib only)
   • iproute2        (the `ip` command – already on Kali)
 Run with sudo OR make sure your user can run `ip link`.
 
@@ -22,15 +22,18 @@ python can_scan.py --send
 python can_scan.py -b 500000 1000000 -t 5
 
 """
-import argparse, os, subprocess, time, random, sys
+import argparse, os, socket, struct, subprocess, time, random, sys
 
-try:
-    import can
-except ImportError:
-    sys.exit("pip install python-can  (inside your venv)")
+if not hasattr(socket, "AF_CAN"):
+    sys.exit("raw SocketCAN (AF_CAN) needs Linux")
 
 DEF_IFACE  = "can0"                             # slcan0 if using slcand
 SCAN_RATES = [125_000, 250_000, 500_000, 1_000_000]
+CAN_FRAME  = struct.Struct("=IB3x8s")           # struct can_frame: id, dlc, data
+TIMEVAL    = struct.Struct("@ll")               # SO_TIMESTAMP payload
+# not exported by the socket module; values from <linux/can/raw.h>, <asm/socket.h>
+CAN_RAW_ERR_FILTER = getattr(socket, "CAN_RAW_ERR_FILTER", 2)
+SO_TIMESTAMP       = getattr(socket, "SO_TIMESTAMP", 29)
 
 # ── sudo-wrapped ip-link ----------------------------------------------
 def ip_link(cmd) -> None:
@@ -45,6 +48,30 @@ def set_bitrate(iface: str, bitrate: int) -> None:
              "bitrate", str(bitrate), "restart-ms", "100"])
     ip_link(["ip", "link", "set", iface, "up"])
 
+# ── raw SocketCAN -----------------------------------------------------
+def open_can(iface: str) -> socket.socket:
+    sock = socket.socket(socket.AF_CAN, socket.SOCK_RAW, socket.CAN_RAW)
+    try:
+        # deliver error frames too, and stamp each frame in the kernel
+        sock.setsockopt(socket.SOL_CAN_RAW, CAN_RAW_ERR_FILTER,
+                        struct.pack("=I", socket.CAN_ERR_MASK))
+        sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMP, 1)
+        sock.bind((iface,))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+def recv_can(sock: socket.socket) -> tuple[float, bytes]:
+    """One frame plus its kernel receive time (host clock as a fallback)"""
+    frame, anc, _, _ = sock.recvmsg(CAN_FRAME.size,
+                                    socket.CMSG_SPACE(TIMEVAL.size))
+    for level, kind, data in anc:
+        if level == socket.SOL_SOCKET and kind == SO_TIMESTAMP:
+            sec, usec = TIMEVAL.unpack_from(data)
+            return sec + usec / 1e6, frame
+    return time.time(), frame
+
 # ── CLI ---------------------------------------------------------------
 ap = argparse.ArgumentParser()
 ap.add_argument("-i", "--iface", default=DEF_IFACE,
@@ -67,35 +94,45 @@ for br in args.bitrates:
         continue
 
     try:
-        bus = can.interface.Bus(channel=args.iface, interface="socketcan")
-    except Exception as e:
+        sock = open_can(args.iface)
+    except OSError as e:
         print(f"  !  open error: {e}")
         continue
 
-    if args.send:
-        payload = os.urandom(8)
-        msg = can.Message(arbitration_id=0x123, data=payload,
-                          is_extended_id=False)
-        try:
-            bus.send(msg)
-            print(f"  →  probe 123#{payload.hex()}")
-        except can.CanError as e:
-            print(f"  !  TX error: {e}")
-
-    seen = False
-    end  = time.time() + args.time
-    while time.time() < end:
-        m = bus.recv(timeout=0.25)
-        if m:
+    try:
+        if args.send:
+            payload = os.urandom(8)
+            try:
+                sock.send(CAN_FRAME.pack(0x123, len(payload), payload))
+                print(f"  →  probe 123#{payload.hex()}")
+            except OSError as e:
+                print(f"  !  TX error: {e}")
+
+        seen = False
+        deadline = time.monotonic() + args.time
+        while (remaining := deadline - time.monotonic()) > 0:
+            sock.settimeout(remaining)     # one blocking wait when idle
+            try:
+                ts, frame = recv_can(sock)
+            except socket.timeout:
+                break
+            can_id, dlc, data = CAN_FRAME.unpack(frame)
             if not seen:
                 print("  ←  traffic:")
                 seen = True
-            ts = f"{m.timestamp:.6f}"
-            canid = f"{m.arbitration_id:08X}" if m.is_extended_id else f"{m.arbitration_id:03X}"
-            print(f"    {ts}  {canid}  [{m.dlc}]  {m.data.hex()}")
-
-    if not seen:
-        print("  (silence)")
-    bus.shutdown()
+            if can_id & socket.CAN_ERR_FLAG:
+                canid = f"ERR {can_id & socket.CAN_ERR_MASK:08X}"
+            elif can_id & socket.CAN_EFF_FLAG:
+                canid = f"{can_id & socket.CAN_EFF_MASK:08X}"
+            else:
+                canid = f"{can_id & socket.CAN_SFF_MASK:03X}"
+            print(f"    {ts:.6f}  {canid}  [{dlc}]  {data[:dlc].hex()}")
+
+        if not seen:
+            print("  (silence)")
+    except OSError as e:                   # bus-off, ENETDOWN, …
+        print(f"  !  RX error: {e}")
+    finally:
+        sock.close()
 
 print("\nScan complete.")
\ No newline at end of file
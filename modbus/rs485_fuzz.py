@@ -11,8 +11,9 @@ Run   python rs485_fuzz.py  --help   for flags.
 Requires:  pip install pyserial
 """
 
-import sys, argparse, time, random, serial, struct, textwrap
-from binascii import crc_hqx
+import os, sys, argparse, time, random, serial, struct, textwrap
+import queue, threading
+from functools import cache
 
 # ---------- serial & protocol defaults ----------
 PORT_DEFAULT = "/dev/cu.usbserial-BG018ZD3"   # change if needed
@@ -26,38 +27,58 @@ POLL_REG  = 0x0051        # register it keeps reading
 POLL_CNT  = 0x0001
 
 FUZZ_STYLES = ("crc", "func", "big", "rand")  # four flavours
+
+_LE_CRC = struct.Struct("<H").pack            # per-request hot path
+_EXC    = struct.Struct(">BBB").pack
+_U16    = struct.Struct(">H").pack
+_REG_CNT = struct.Struct(">HH")              # request start-register, count
 # -----------------------------------------------------------
 
-def crc(frame: bytes) -> bytes:
-    """True Modbus CRC-16 (poly 0xA001, init 0xFFFF) – little-endian"""
-    crc_val = 0xFFFF
+def _crc_entry(crc_val: int) -> int:
+    for _ in range(8):
+        crc_val = (crc_val >> 1) ^ (0xA001 & -(crc_val & 1))
+    return crc_val
+
+_CRC16_TABLE = tuple(_crc_entry(i) for i in range(256))   # Sarwate LUT
+
+def crc_state(frame: bytes, crc_val: int = 0xFFFF) -> int:
+    """CRC register after feeding frame; pass it back in to continue"""
     for b in frame:
-        crc_val ^= b
-        for _ in range(8):
-            if crc_val & 1:
-                crc_val = (crc_val >> 1) ^ 0xA001
-            else:
-                crc_val >>= 1
-    return struct.pack("<H", crc_val)
+        crc_val = (crc_val >> 8) ^ _CRC16_TABLE[(crc_val ^ b) & 0xFF]
+    return crc_val
+
+def crc(frame: bytes, crc_val: int = 0xFFFF) -> bytes:
+    """True Modbus CRC-16 (poly 0xA001, init 0xFFFF) – little-endian"""
+    return _LE_CRC(crc_state(frame, crc_val))
 
 # -----------------------------------------------
 
 
 
+# Frames below are cached on first use, which is after main() has fixed
+# SLAVE_ID, so they are built once per run instead of once per poll.
+
+@cache
+def good_header():
+    hdr = struct.pack(">BBB", SLAVE_ID, 0x03, 0x02)
+    return hdr, crc_state(hdr)
+
 def good_response():
     # Build: 01 03 02 <hi> <lo> CRC
-    val  = random.randint(0, 0xFFFF)
-    body = struct.pack(">BBBH", SLAVE_ID, 0x03, 0x02, val)
-    return body + crc(body)
+    hdr, state = good_header()
+    val = _U16(random.randint(0, 0xFFFF))
+    return hdr + val + crc(val, state)
 
 # -- fuzzers ------------------------------------------------
 def fuzz_crc(frame):                     # body OK, CRC zeroed
     return frame[:-2] + b"\x00\x00"
 
+@cache
 def fuzz_illegal_function():
     body = struct.pack(">BBBB", SLAVE_ID, 0x04, 0x00, 0x00)
     return body + crc(body)
 
+@cache
 def fuzz_big_count():
     BIG = 252                       # maximum spec-conformant data bytes
     body    = struct.pack(">BBBH", SLAVE_ID, 0x03, BIG, 0x0000)
@@ -68,7 +89,7 @@ def fuzz_big_count():
 
 
 def fuzz_random():
-    payload = bytes(random.getrandbits(8) for _ in range(random.randint(5,50)))
+    payload = os.urandom(random.randint(5,50))
     body    = struct.pack(">B", SLAVE_ID) + payload
     return body + crc(body)
 
@@ -79,7 +100,35 @@ FUZZ_MAP = {"crc": fuzz_crc,
 # -----------------------------------------------------------
 
 def hexline(b: bytes) -> str:
-    return " ".join(f"{x:02X}" for x in b)
+    return b.hex(" ").upper()
+
+# -- logging off the responder path ---------------------------
+log_q = queue.SimpleQueue()
+
+def log(fmt: str, frame: bytes = b"") -> None:
+    """Queue a line; '{}' in fmt is replaced by the frame's hex dump"""
+    log_q.put_nowait((fmt, frame))
+
+def logger() -> None:
+    """Format queued lines and print each backlog with a single write"""
+    while True:
+        batch = [log_q.get()]
+        while not log_q.empty():
+            batch.append(log_q.get_nowait())
+        stop = batch[-1] is None        # sentinel from stop_logger()
+        sys.stdout.write("".join(fmt.format(hexline(frame)) + "\n"
+                                 for fmt, frame in batch[:-1 if stop else None]))
+        sys.stdout.flush()
+        if stop:
+            return
+
+log_thread = threading.Thread(target=logger, daemon=True)
+
+def stop_logger() -> None:
+    """Print whatever is still queued, then end the logger thread"""
+    if log_thread.is_alive():
+        log_q.put(None)
+        log_thread.join()
 
 def parse_cli():
     p = argparse.ArgumentParser(
@@ -105,30 +154,47 @@ def main():
     global SLAVE_ID; SLAVE_ID = opts.id
 
     ser = serial.Serial(opts.port, BAUD, BYTESIZE, PARITY, STOPBITS, timeout=0.05)
+    try:                                # reply inside the master's timeout
+        ser.set_low_latency_mode(True)  # Linux only; macOS raises
+    except (NotImplementedError, AttributeError, ValueError, OSError):
+        pass
     print(f"[+] Listening on {ser.port} 115200-8N2  as slave {SLAVE_ID}")
+    log_thread.start()
 
+    addr, buf = bytes([SLAVE_ID]), bytearray()
     poll, fuzz_cycle = 0, list(FUZZ_STYLES)
     while True:
-        if (head := ser.read(1)) != bytes([SLAVE_ID]):
-            continue                    # not addressed to us
-
-        req = head + ser.read(7)        # full 8-byte request
-        if len(req) < 8:
+        if (start := buf.find(addr)) < 0:
+            buf.clear()                 # nothing addressed to us
+        else:
+            del buf[:start]
+
+        if len(buf) < 8:
+            # whole backlog, or block once for the rest of a partial frame
+            chunk = ser.read(max(ser.in_waiting, 8 - len(buf)))
+            if not chunk:
+                buf.clear()             # line went idle: drop partial frame
+            buf += chunk
             continue
-        print(f"←  {hexline(req)}")
+
+        req = bytes(buf[:8])            # full 8-byte request
+        log("←  {}", req)
 
         if crc(req[:-2]) != req[-2:]:
-            print("   [!] bad CRC in request")
+            log("   [!] bad CRC in request")
+            del buf[:1]                 # resync on the next address byte
             continue
+        del buf[:8]
 
-        func, reg, cnt = req[1], *struct.unpack(">HH", req[2:6])
+        func = req[1]
+        reg, cnt = _REG_CNT.unpack_from(req, 2)
 
         # Decide whether to fuzz
         if opts.fuzz and poll % opts.fuzz == 0:
             style = opts.fuzz_type or fuzz_cycle[(poll // opts.fuzz) % 4]
             frame = FUZZ_MAP[style](req)
             ser.write(frame)
-            print(f"→  (FUZZ:{style}) {hexline(frame)}")
+            log(f"→  (FUZZ:{style}) {{}}", frame)
             poll += 1
             continue
 
@@ -136,11 +202,12 @@ def main():
         if func == 0x03 and reg == POLL_REG and cnt == POLL_CNT:
             resp = good_response()
             ser.write(resp)
-            print(f"→  {hexline(resp)}  (ok)")
+            log("→  {}  (ok)", resp)
         else:
-            exc  = struct.pack(">BBB", SLAVE_ID, func | 0x80, 0x02)
-            ser.write(exc + crc(exc))
-            print(f"→  {hexline(exc + crc(exc))}  (exc)")
+            exc  = _EXC(SLAVE_ID, func | 0x80, 0x02)
+            exc += crc(exc)
+            ser.write(exc)
+            log("→  {}  (exc)", exc)
 
         poll += 1
 
@@ -148,4 +215,7 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
+        stop_logger()                   # trace first, then the banner
         print("\n[+] Stopped")
+    finally:
+        stop_logger()                   # any exit path keeps the last frames
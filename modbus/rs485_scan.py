@@ -25,13 +25,16 @@ STOPBITS = {1: serial.STOPBITS_ONE,
 TEST_PAYLOAD = b'\r'          # what we transmit each trial
 # ---------------------------------------------------------
 
+# byte -> itself if printable ASCII, else '.'
+PRINTABLE = bytes(b if 32 <= b < 127 else ord('.') for b in range(256))
+
 def hexdump(data: bytes, width: int = 16) -> str:
     """return a printable hex+ASCII line for bytes"""
     s = []
     for i in range(0, len(data), width):
         chunk = data[i:i+width]
-        hexpart = ' '.join(f'{b:02X}' for b in chunk).ljust(width*3-1)
-        txtpart = ''.join(chr(b) if 32 <= b < 127 else '.' for b in chunk)
+        hexpart = chunk.hex(' ').upper().ljust(width*3-1)
+        txtpart = chunk.translate(PRINTABLE).decode('ascii')
         s.append(f"{hexpart}  {txtpart}")
     return '\n    '.join(s)
 
@@ -49,28 +52,35 @@ def main():
                                     BYTESIZE.items(), STOPBITS.items()))
     print(f"Scanning {len(combos)} permutations on {port}\n")
 
-    for baud, (par_char, parity), (bits, bytesize), (stops, stopbits) in combos:
-        label = (f"{baud:6d} {bits}{par_char}{stops}")
-        try:
-            with serial.Serial(port=port,
-                               baudrate=baud,
-                               bytesize=bytesize,
-                               parity=parity,
-                               stopbits=stopbits,
-                               timeout=dwell) as ser:
+    # Open once and retune per combo: apply_settings() re-runs tcsetattr for
+    # each changed setting (up to four per combo), which is still far
+    # cheaper than reopening a USB-serial adapter.
+    try:
+        ser = serial.Serial(port=port, timeout=dwell)
+    except serial.SerialException as e:
+        sys.exit(f"[!] {port}: {e}")
+
+    with ser:
+        for baud, (par_char, parity), (bits, bytesize), (stops, stopbits) in combos:
+            label = (f"{baud:6d} {bits}{par_char}{stops}")
+            try:
+                ser.apply_settings({'baudrate': baud,
+                                    'bytesize': bytesize,
+                                    'parity':   parity,
+                                    'stopbits': stopbits})
                 # Flush & probe
                 ser.reset_input_buffer()
                 ser.write(TEST_PAYLOAD)
                 time.sleep(0.01)         # Give DE line time to release
                 data = ser.read(128)
 
-            if data:
-                print(f"[+] {label}: {len(data)} byte(s)")
-                print(f"    {hexdump(data)}")
-            else:
-                print(f"[-] {label}: silence")
-        except serial.SerialException as e:
-            print(f"[!] {label}: {e}")
+                if data:
+                    print(f"[+] {label}: {len(data)} byte(s)")
+                    print(f"    {hexdump(data)}")
+                else:
+                    print(f"[-] {label}: silence")
+            except serial.SerialException as e:
+                print(f"[!] {label}: {e}")
 
 if __name__ == "__main__":
     main()
@@ -6,12 +6,17 @@ Legal but maximal; stresses heap in many stacks.
 
 import os, time, struct, serial, random
 
+def _crc_entry(c):
+    for _ in range(8):
+        c=(c>>1)^(0xA001&-(c&1))
+    return c
+
+_CRC16_TABLE=tuple(_crc_entry(i) for i in range(256))
+
 def crc(b):
     c=0xFFFF
     for x in b:
-        c ^= x
-        for _ in range(8):
-            c=(c>>1)^0xA001 if c&1 else c>>1
+        c=(c>>8)^_CRC16_TABLE[(c^x)&0xFF]
     return struct.pack("<H",c)
 
 ser=serial.Serial("/dev/cu.usbserial-BG018ZD3",115200,8,'N',2)
@@ -21,7 +26,9 @@ payload=os.urandom(WR*2)
 body=struct.pack(">B B H H H",1,0x17,0x0050,1,WR)+struct.pack(">B",WR*2)+payload
 frame=body+crc(body)
 
+due=time.monotonic()
 while True:
     ser.write(frame)
     print("→ 0x17 125-reg frame sent")
-    time.sleep(1)
+    due=max(due+1,time.monotonic())     # fixed 1 s period; no catch-up burst
+    time.sleep(max(0.0,due-time.monotonic()))